@@ -1,5 +1,15 @@
 import abc
+import concurrent.futures
+import contextlib
+import datetime
+import json
+import math
+import os
 import pathlib
+import subprocess as sp
+import sys
+import tempfile
+import uuid
 
 import discretisedfield as df
 import micromagneticmodel as mm
@@ -8,8 +18,40 @@ import ubermagtable as ut
 import ubermagutil as uu
 
 import oommfc as oc
-
-
+from oommfc.oommf.oommf import _spawn_kwargs
+
+try:
+    import psutil
+except ImportError:  # psutil is optional
+    psutil = None
+
+# Input files are written through a large buffer, so that they typically reach
+# the disk in a single system call.
+_BUFFER_SIZE = 1 << 20
+
+
+@contextlib.contextmanager
+def _atomic_open(filename):
+    """Open ``filename`` for writing and replace it atomically when done.
+
+    The data is written to a uniquely named temporary file through a large buffer,
+    which then replaces ``filename``. A process killed while writing therefore never
+    leaves a truncated file behind and concurrent writers do not interfere. The
+    temporary file is removed if writing fails.
+    """
+    # Unlike tempfile.mkstemp, open creates the file with the default permissions.
+    tmpfile = f"{filename}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmpfile, "xt", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmpfile, filename)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmpfile)
+        raise
+
+
+@uu.inherit_docs
 class Driver(mm.ExternalDriver):
     """Driver base class."""
 
@@ -107,6 +149,424 @@ class Driver(mm.ExternalDriver):
         schedule_kwargs.setdefault("output_step", False)
         schedule_kwargs.setdefault("compute", None)
 
+    def drive_many(
+        self,
+        systems,
+        /,
+        dirname=".",
+        append=True,
+        runner=None,
+        ovf_format="bin8",
+        verbose=1,
+        max_parallel=None,
+        mem_per_job=None,
+        **kwargs,
+    ):
+        """Drive multiple systems in phase space in parallel.
+
+        Each system is driven in the same way as with ``Driver.drive``. The input
+        files are written for all systems first, then up to ``max_parallel`` OOMMF
+        runs are executed at the same time, and finally the results are read into
+        the individual systems.
+
+        Parameters
+        ----------
+        systems : list
+
+            List of ``micromagneticmodel.System`` objects to be driven.
+
+        dirname : str, optional
+
+            Name of a base directory in which the simulation results are stored.
+            Additional subdirectories based on the system name and the current drive
+            number are created automatically. If not specified the current working
+            directory is used.
+
+        append : bool, optional
+
+            If ``True`` and the system directory already exists, drive or
+            compute directories will be appended. Defaults to ``True``.
+
+        runner : oommfc.oommf.OOMMFRunner, optional
+
+            OOMMF Runner which is going to be used for running the calculations. If
+            ``None``, the default runner is used. Defaults to ``None``.
+
+        ovf_format : str
+
+            Format of the magnetisation output files written by OOMMF. Can be
+            one of ``'bin8'`` (binary, double precision), ``'bin4'`` (binary,
+            single precision) or ``'txt'`` (text-based, double precision).
+            Defaults to ``'bin8'``.
+
+        verbose : int, optional
+
+            If ``verbose=0``, no output is printed. For ``verbose>=1`` the number of
+            systems and parallel runs is printed to stdout. Defaults to ``1``.
+
+        max_parallel : int, optional
+
+            Maximum number of simultaneous OOMMF runs. If not specified, the number
+            of CPUs divided by the number of threads per OOMMF run (``n_threads``,
+            ``OOMMF_THREADS``, or 4) is used. On Windows, OOMMF runs are always
+            executed one after the other.
+
+        mem_per_job : int, optional
+
+            Memory in bytes required by a single OOMMF run. If specified, the number
+            of simultaneous runs is additionally limited by the available memory.
+
+        kwargs
+
+            Additional keyword arguments passed to each drive. These are documented
+            in ``drive_kwargs_setup``.
+
+        Raises
+        ------
+        RuntimeError
+
+            If one of the OOMMF runs fails. The first error is raised after all runs
+            have finished and the results of all successful runs have been read.
+
+        Examples
+        --------
+        1. Driving multiple systems.
+
+        >>> import micromagneticmodel as mm
+        >>> import oommfc as oc
+        ...
+        >>> systems = [mm.examples.macrospin() for _ in range(2)]
+        >>> td = oc.TimeDriver()
+        >>> td.drive_many(systems, t=1e-12, n=5, verbose=0)
+
+        """
+        if runner is None:
+            runner = oc.runner.runner
+
+        runs = []
+        for system in systems:
+            drive_kwargs = kwargs.copy()
+            self.drive_kwargs_setup(drive_kwargs)
+            self._check_system(system)
+            workingdir = self._setup_working_directory(
+                system=system, dirname=dirname, mode="drive", append=append
+            )
+            with uu.changedir(workingdir):
+                self._write_input_files(
+                    system=system, ovf_format=ovf_format, **drive_kwargs
+                )
+            runs.append((system, workingdir.absolute(), drive_kwargs))
+
+        if sys.platform == "win32":
+            # OOMMF processes are killed after each run on Windows.
+            max_parallel = 1  # pragma: no cover
+        elif max_parallel is None:
+            max_parallel = self._max_parallel(kwargs.get("n_threads"), mem_per_job)
+        if verbose >= 1:
+            print(f"Running OOMMF for {len(runs)} systems ({max_parallel} parallel).")
+
+        # The working directory is shared by all threads and is therefore passed to
+        # the runner (at the cost of subprocess not using posix_spawn).
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as pool:
+            futures = [
+                pool.submit(
+                    runner.call,
+                    argstr=self._miffilename(system),
+                    n_threads=drive_kwargs["n_threads"],
+                    verbose=0,
+                    cwd=workingdir,
+                )
+                for system, workingdir, drive_kwargs in runs
+            ]
+
+        # Results of all successful runs are read before the first error (of a run
+        # or while reading its results) is raised.
+        errors = []
+        for (system, workingdir, _), future in zip(runs, futures):
+            try:
+                future.result()
+                with uu.changedir(workingdir):
+                    self._read_data(system)
+            except Exception as e:
+                errors.append(e)
+                continue
+            system.drive_number += 1
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def _max_parallel(n_threads, mem_per_job):
+        if n_threads is None:
+            n_threads = int(os.environ.get("OOMMF_THREADS", 4))
+        max_parallel = (os.cpu_count() or 1) // n_threads
+        if mem_per_job is not None:
+            available_memory = Driver._available_memory()
+            if available_memory is not None:
+                max_parallel = min(max_parallel, available_memory // mem_per_job)
+        return max(max_parallel, 1)
+
+    @staticmethod
+    def _available_memory():
+        if psutil is not None:
+            return psutil.virtual_memory().available
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, OSError, ValueError):  # not available on all systems
+            return None
+
+    def schedule(
+        self,
+        system,
+        cmd,
+        header,
+        script_name="job.sh",
+        dirname=".",
+        append=True,
+        runner=None,
+        ovf_format="bin8",
+        verbose=1,
+        **kwargs,
+    ):
+        # This method is implemented in the derived driver class. It raises
+        # exception if any of the arguments are not valid.
+        self.schedule_kwargs_setup(kwargs)
+        self._check_system(system)
+        workingdir = self._setup_working_directory(
+            system=system, dirname=dirname, mode="drive", append=append
+        )
+
+        # Convert to absolute path if it is a file name because the file will be
+        # accessed from a different directory.
+        if pathlib.Path(header).exists():
+            header = pathlib.Path(header).absolute()
+
+        with uu.changedir(workingdir):
+            self._write_input_files(
+                system=system,
+                ovf_format=ovf_format,
+                **kwargs,
+            )
+            self._write_schedule_script(
+                system=system, header=header, script_name=script_name, runner=runner
+            )
+
+            if verbose >= 1:
+                print(
+                    f"Running '{cmd} {script_name}' in '{pathlib.Path().absolute()}'."
+                )
+            system.drive_number += 1
+            self._submit(cmd, script_name)
+
+    def schedule_many(
+        self,
+        systems,
+        cmd,
+        header,
+        script_name="job.sh",
+        array_header="#SBATCH --array=0-{last}",
+        task_id="SLURM_ARRAY_TASK_ID",
+        dirname=".",
+        append=True,
+        runner=None,
+        ovf_format="bin8",
+        verbose=1,
+        **kwargs,
+    ):
+        """Schedule drives of multiple systems as a single job array.
+
+        The input files for all systems are written in the same way as with
+        ``Driver.schedule``. Instead of submitting one job per system, a single job
+        array script ``script_name`` is written to ``dirname`` and submitted once.
+        Each array task runs the drive of one system, selected by its task index.
+
+        Parameters
+        ----------
+        systems : list
+
+            List of ``micromagneticmodel.System`` objects to be driven.
+
+        cmd : str
+
+            Name of the scheduling system's submission program, e.g. ``'sbatch'`` for
+            Slurm.
+
+        header : str
+
+            Filename of the submission header file or str with the data to specify
+            system requirements such as number of CPUs and memory. The requirements
+            apply to each array task.
+
+        script_name : str, optional
+
+            Name of the job array script that is written to ``dirname`` and
+            scheduled for execution. Defaults to ``'job.sh'``.
+
+        array_header : str, optional
+
+            Header line defining the job array. ``{last}`` is replaced with the
+            index of the last task. Defaults to ``'#SBATCH --array=0-{last}'``.
+
+        task_id : str, optional
+
+            Name of the environment variable containing the task index inside a
+            running task. Defaults to ``'SLURM_ARRAY_TASK_ID'``.
+
+        dirname : str, optional
+
+            Name of a base directory in which the simulation results are stored.
+            Additional subdirectories based on the system name and the current drive
+            number are created automatically. If not specified the current working
+            directory is used.
+
+        append : bool, optional
+
+            If ``True`` and the system directory already exists, drive or
+            compute directories will be appended. Defaults to ``True``.
+
+        runner : oommfc.oommf.OOMMFRunner, optional
+
+            OOMMF Runner which is going to be used in the scheduled jobs. If
+            ``None``, the default runner is used. Defaults to ``None``.
+
+        ovf_format : str
+
+            Format of the magnetisation output files written by OOMMF. Can be
+            one of ``'bin8'`` (binary, double precision), ``'bin4'`` (binary,
+            single precision) or ``'txt'`` (text-based, double precision).
+            Defaults to ``'bin8'``.
+
+        verbose : int, optional
+
+            If ``verbose=0``, no output is printed. For ``verbose=1`` information about
+            the submitted job is printed to stdout. Defaults to ``1``.
+
+        kwargs
+
+            Additional keyword arguments passed to each drive. These are documented
+            in ``schedule_kwargs_setup``.
+
+        Raises
+        ------
+        ValueError
+
+            If ``systems`` is empty.
+
+        RuntimeError
+
+            If the job array cannot be submitted.
+
+        """
+        systems = list(systems)
+        if not systems:
+            raise ValueError("At least one system is required.")
+        # Resolve the default runner only once for all systems.
+        if runner is None:
+            runner = oc.runner.runner
+        if pathlib.Path(header).exists():
+            with open(header, encoding="utf-8") as f:
+                header = f.read()
+
+        tasks = []
+        for index, system in enumerate(systems):
+            schedule_kwargs = kwargs.copy()
+            self.schedule_kwargs_setup(schedule_kwargs)
+            self._check_system(system)
+            workingdir = self._setup_working_directory(
+                system=system, dirname=dirname, mode="drive", append=append
+            )
+            with uu.changedir(workingdir):
+                self._write_input_files(
+                    system=system, ovf_format=ovf_format, **schedule_kwargs
+                )
+                run_commands = self._schedule_commands(system=system, runner=runner)
+            tasks.append(f"  {index})")
+            tasks.append(f'    cd "{workingdir.absolute()}"')
+            tasks.extend(f"    {command}" for command in run_commands)
+            tasks.append("    ;;")
+
+        # Scheduler directives are only parsed before the first command in the
+        # header, so the array definition directly follows the shebang line.
+        script = header.split("\n")
+        script.insert(
+            1 if script[0].startswith("#!") else 0,
+            array_header.format(last=len(systems) - 1),
+        )
+        script += [f"case ${task_id} in", *tasks, "esac"]
+        with uu.changedir(dirname):
+            with _atomic_open(script_name) as f:
+                f.write("\n".join(script))
+            if verbose >= 1:
+                print(
+                    f"Running '{cmd} {script_name}' in '{pathlib.Path().absolute()}'."
+                )
+            for system in systems:
+                system.drive_number += 1
+            self._submit(cmd, script_name)
+
+    def _write_schedule_script(self, system, header, script_name, runner):
+        # The header is copied as bytes and the script is written in one call.
+        if pathlib.Path(header).exists():
+            header = pathlib.Path(header).read_bytes()
+        else:
+            header = header.encode("utf-8")
+        run_commands = self._schedule_commands(system=system, runner=runner)
+        script = header + b"\n" + "\n".join(run_commands).encode("utf-8")
+        pathlib.Path(script_name).write_bytes(script)
+
+    @staticmethod
+    def _submit(cmd, script_name):
+        # Output is redirected to temporary files rather than pipes and is only
+        # read if the submission fails.
+        with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+            if sys.platform == "win32":
+                res = sp.run([cmd, script_name])  # pragma: no cover
+            else:
+                res = sp.run(
+                    [cmd, script_name],
+                    stdout=stdout,
+                    stderr=stderr,
+                    **_spawn_kwargs([cmd]),
+                )
+
+            if res.returncode != 0:
+                msg = "Error during job schedule.\n"
+                msg += f"command: {cmd} {script_name}\n"
+                if sys.platform != "win32":
+                    # Only on Linux and MacOS - on Windows we do not get stderr and
+                    # stdout.
+                    stdout.seek(0)
+                    stderr.seek(0)
+                    msg += f"stdout: {stdout.read().decode('utf-8', 'replace')}\n"
+                    msg += f"stderr: {stderr.read().decode('utf-8', 'replace')}\n"
+                raise RuntimeError(msg)
+
+    @staticmethod
+    def _setup_working_directory(system, dirname, mode, append=True):
+        system_dir = pathlib.Path(dirname, system.name)
+        if system_dir.exists() and not append:
+            raise FileExistsError(
+                f"Directory {system.name=} already exists. To "
+                "append drives to it, pass append=True."
+            )
+        # Single pass over the directory; the highest number wins, so that
+        # manually created directories are never reused.
+        prefix = f"{mode}-"
+        try:
+            with os.scandir(system_dir) as entries:
+                numbers = [
+                    int(entry.name[len(prefix) :])
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name[len(prefix) :].isdecimal()
+                ]
+        except FileNotFoundError:
+            numbers = []
+        next_number = max(numbers, default=-1) + 1
+        setattr(system, f"{mode}_number", next_number)
+        workingdir = system_dir / f"{mode}-{next_number}"
+        workingdir.mkdir(parents=True)
+        return workingdir
+
     def _write_input_files(self, system, **kwargs):
         self.write_mif(system, **kwargs)
 
@@ -192,7 +652,7 @@ class Driver(mm.ExternalDriver):
                 compute=compute,
                 **kwargs,
             )
-            with open(self._miffilename(system), "wt", encoding="utf-8") as miffile:
+            with _atomic_open(self._miffilename(system)) as miffile:
                 miffile.write(mif)
 
             # Generate and save json info file for a drive (not compute).
@@ -203,6 +663,22 @@ class Driver(mm.ExternalDriver):
         if hasattr(self.evolver, "fixed_spins"):
             del self.evolver.fixed_spins
 
+    def _write_info_json(self, system, **kwargs):
+        info = {}
+        info["drive_number"] = system.drive_number
+        # a single timestamp ensures that date and time are consistent
+        now = datetime.datetime.now()
+        info["date"] = now.strftime("%Y-%m-%d")
+        info["time"] = now.strftime("%H:%M:%S")
+        info["driver"] = self.__class__.__name__
+        # "adapter" is the ubermag package (e.g. oommfc) that communicates with the
+        # calculator (e.g. OOMMF)
+        info["adapter"] = self.__module__.split(".")[0]
+        for k, v in kwargs.items():
+            info[k] = v
+        with _atomic_open("info.json") as jsonfile:
+            json.dump(info, jsonfile, separators=(",", ":"))
+
     def _call(self, system, runner, n_threads=None, verbose=1, **kwargs):
         if runner is None:
             runner = oc.runner.runner
@@ -226,15 +702,59 @@ class Driver(mm.ExternalDriver):
     def _read_data(self, system):
         # Update system's magnetisation. An example .omf filename:
         # test_sample-Oxs_TimeDriver-Magnetization-01-0000008.omf
-        omffiles = pathlib.Path(".").glob(f"{system.name}*.omf")
-        lastomffile = sorted(omffiles)[-1]
+        # Single pass over the directory; the last file has the highest number.
+        name = system.name
+        with os.scandir(".") as entries:
+            lastomffile = max(
+                entry.name
+                for entry in entries
+                if entry.name.startswith(name) and entry.name.endswith(".omf")
+            )
         # pass Field.array instead of Field to system.m.value
         # - to avoid overriding component labels
         # - to avoid overriding subregions
         # - for better performance
-        system.m.array = df.Field.from_file(str(lastomffile)).array
+        array = self._read_omf_array(lastomffile, system.m.array.shape)
+        if array is None:
+            array = df.Field.from_file(lastomffile).array
+        system.m.array = array
+
+        system.table = ut.Table.fromfile(f"{name}.odt", x=self._x)
 
-        system.table = ut.Table.fromfile(f"{system.name}.odt", x=self._x)
+    @staticmethod
+    def _read_omf_array(filename, shape):
+        """Read the array of an OVF 2.0 file with binary 8 data directly.
+
+        Building a ``discretisedfield.Field`` is not required to update the
+        magnetisation. ``None`` is returned for all other formats or if the file does
+        not match ``shape``, ``(nx, ny, nz, 3)``.
+        """
+        nodes = {}
+        with open(filename, "rb") as f:
+            if b"2.0" not in f.readline():
+                return None
+            for line in f:
+                if line.lower().startswith(b"# begin: data"):
+                    if line.split()[3:] != [b"Binary", b"8"]:
+                        return None
+                    break
+                key, _, value = line[1:].partition(b":")
+                if key.strip() in (b"xnodes", b"ynodes", b"znodes"):
+                    nodes[key.strip()[:1]] = int(value)
+            else:
+                return None
+
+            if (nodes.get(b"x"), nodes.get(b"y"), nodes.get(b"z"), 3) != shape:
+                return None
+            if np.fromfile(f, dtype="<f8", count=1).tolist() != [123456789012345.0]:
+                return None
+            count = math.prod(shape)
+            array = np.fromfile(f, dtype="<f8", count=count)
+
+        if array.size != count:
+            return None
+        # OVF ordering: x changes fastest
+        return array.reshape(shape[2::-1] + shape[3:]).transpose((2, 1, 0, 3))
 
     @staticmethod
     def _time_dependence(term, **kwargs):
@@ -246,14 +766,35 @@ class Driver(mm.ExternalDriver):
                 "used with time driver."
             ) from None
         ts = np.arange(0, tmax + term.dt, term.dt)
-        try:  # vector output from term.func
-            tlist = [list(term.func(t)) for t in ts]
-            dtlist = (np.gradient(tlist)[0] / term.dt).tolist()
-        except TypeError:  # scalar output from term.func
-            tlist = [term.func(t) for t in ts]
-            dtlist = list(np.gradient(tlist) / term.dt)
-        term.tlist = tlist
-        term.dtlist = dtlist
+        values = Driver._evaluate_func(term.func, ts)
+        # vector output from term.func results in a list of lists
+        term.tlist = values.tolist()
+        term.dtlist = np.gradient(values, term.dt, axis=0).tolist()
+
+    @staticmethod
+    def _evaluate_func(func, ts):
+        """Evaluate ``func`` for all time steps in ``ts``.
+
+        If ``func`` supports NumPy arrays, it is called once for the whole array.
+        Otherwise, it is evaluated for each time step individually. The result has
+        shape ``(len(ts),)`` for scalar and ``(len(ts), n)`` for vector output.
+        """
+        reference = np.asarray([func(t) for t in ts[:2]], dtype=float)
+        try:
+            vectorised = np.asarray(func(ts[:2]), dtype=float)
+        except Exception:
+            vectorised = None
+
+        if (
+            vectorised is not None
+            and vectorised.shape == reference.shape
+            and np.allclose(vectorised, reference)
+        ):
+            values = np.asarray(func(ts), dtype=float)
+            if values.shape == (len(ts), *reference.shape[1:]):
+                return values
+
+        return np.asarray([func(t) for t in ts], dtype=float)
 
     @staticmethod
     def _miffilename(system):
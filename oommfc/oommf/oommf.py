@@ -30,6 +30,25 @@ def _global_cleanup():
 atexit.register(_global_cleanup)
 
 
+def _spawn_kwargs(command):
+    """Additional ``subprocess.run`` arguments to start ``command`` cheaply.
+
+    CPython uses ``posix_spawn`` instead of ``fork`` and ``exec`` only if the
+    executable is passed as a path and file descriptors are not closed explicitly.
+    File descriptors created by Python are not inheritable, so not closing them is
+    safe. ``posix_spawn`` is also not used if ``cwd`` is passed, e.g. for the
+    parallel runs of ``Driver.drive_many``, which therefore use ``fork`` and
+    ``exec``.
+
+    """
+    if sys.platform == "win32":
+        return {}  # pragma: no cover
+    executable = shutil.which(command[0])
+    if executable is None:
+        return {}  # subprocess reports the missing executable
+    return {"executable": executable, "close_fds": False}
+
+
 class OOMMFRunner(mm.ExternalRunner):
     """Abstract class for running OOMMF."""
 
@@ -56,7 +75,7 @@ class OOMMFRunner(mm.ExternalRunner):
         """Simulation package name."""
         return "OOMMF"
 
-    def _call(self, argstr, need_stderr=False, n_threads=None, dry_run=False):
+    def _call(self, argstr, need_stderr=False, n_threads=None, dry_run=False, cwd=None):
         """This method should be implemented in subclass."""
 
     @abc.abstractmethod
@@ -190,11 +209,11 @@ class NativeOOMMFRunner(OOMMFRunner):
         if dry_run:
             return " ".join(command)
         else:
-            launchhost = sp.run(command, stdout=sp.PIPE)
+            launchhost = sp.run(command, stdout=sp.PIPE, **_spawn_kwargs(command))
             port = launchhost.stdout.decode("utf-8", "replace").strip("\n")
             return port
 
-    def _call(self, argstr, need_stderr=False, n_threads=None, dry_run=False):
+    def _call(self, argstr, need_stderr=False, n_threads=None, dry_run=False, cwd=None):
         command = [*self.oommf, "boxsi", "+fg", argstr, "-exitondone", "1"]
 
         # Not clear why we cannot get stderr and stdout on win32. Calls to
@@ -210,7 +229,14 @@ class NativeOOMMFRunner(OOMMFRunner):
             return " ".join(command)
         else:
             with self._kill_oommf_on_windows():
-                return sp.run(command, stdout=stdout, stderr=stderr, env=self.env)
+                return sp.run(
+                    command,
+                    stdout=stdout,
+                    stderr=stderr,
+                    env=self.env,
+                    cwd=cwd,
+                    **_spawn_kwargs(command),
+                )
 
     @contextlib.contextmanager
     def _kill_oommf_on_windows(self, targets=("all",)):
@@ -228,7 +254,7 @@ class NativeOOMMFRunner(OOMMFRunner):
         else:
             # Quietly kill oommf when used interactively
             command.insert(-1, "-q")
-            sp.run(command, env=self.env)
+            sp.run(command, env=self.env, **_spawn_kwargs(command))
 
 
 @uu.inherit_docs
@@ -332,12 +358,12 @@ class DockerOOMMFRunner(OOMMFRunner):
         if dry_run:
             return ""
 
-    def _call(self, argstr, need_stderr=False, n_threads=None, dry_run=False):
+    def _call(self, argstr, need_stderr=False, n_threads=None, dry_run=False, cwd=None):
         cmd = [
             self.docker_exe,
             "run",
             "-v",
-            f"{os.getcwd()}:/io{':z' if self.selinux else ''}",
+            f"{cwd or os.getcwd()}:/io{':z' if self.selinux else ''}",
             self.image,
             "/bin/bash",
             "-c",
@@ -348,7 +374,7 @@ class DockerOOMMFRunner(OOMMFRunner):
         if dry_run:
             return " ".join(cmd)
         else:
-            return sp.run(cmd, stdout=sp.PIPE, stderr=sp.PIPE)
+            return sp.run(cmd, stdout=sp.PIPE, stderr=sp.PIPE, **_spawn_kwargs(cmd))
 
     def _kill(self, targets=("all",), dry_run=False):
         # There is no need to kill OOMMF when run inside docker.
@@ -19,3 +19,9 @@ def skip_unsupported_or_missing(request):
     )
     if requesting_test_function in not_supported_by_oommf:
         pytest.skip("Not supported by OOMMF.")
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    # Simulations write their output to the current working directory.
+    monkeypatch.chdir(tmp_path)
@@ -0,0 +1,177 @@
+import json
+import math
+import types
+
+import discretisedfield as df
+import micromagneticmodel as mm
+import numpy as np
+import pytest
+
+import oommfc as oc
+
+
+def test_info_json(tmp_path):
+    system = mm.examples.macrospin()
+    td = oc.TimeDriver()
+    td.write_mif(system, dirname=tmp_path, t=1e-12, n=5)
+
+    info = json.loads((tmp_path / "info.json").read_text())
+    assert info["drive_number"] == 0
+    assert info["driver"] == "TimeDriver"
+    assert info["adapter"] == "oommfc"
+    assert info["t"] == 1e-12
+    assert info["n"] == 5
+    assert {"date", "time"} <= info.keys()
+
+
+def _time_dependence_loop(func, tmax, dt):
+    # Reference: evaluation of func for each time step individually.
+    ts = np.arange(0, tmax + dt, dt)
+    try:  # vector output from func
+        tlist = [list(func(t)) for t in ts]
+        dtlist = (np.gradient(tlist)[0] / dt).tolist()
+    except TypeError:  # scalar output from func
+        tlist = [func(t) for t in ts]
+        dtlist = list(np.gradient(tlist) / dt)
+    return tlist, dtlist
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        np.sin,  # vectorised
+        math.sin,  # raises for arrays
+        lambda t: 1.0 if t < 5e-12 else 0.5,  # piecewise, raises for arrays
+        lambda t: 2.0,  # constant, wrong shape for arrays
+        lambda t: [np.cos(t), np.sin(t), 0],  # list, ragged for arrays
+        lambda t: (t, 2 * t, 3 * t),  # tuple, wrong shape for arrays
+        lambda t: [math.exp(-t * 1e11)] * 9,  # 9-vector, raises for arrays
+        lambda t: np.stack([t] * 9, axis=-1),  # 9-vector, vectorised
+    ],
+)
+def test_time_dependence(func):
+    term = types.SimpleNamespace(func=func, dt=1e-13)
+    oc.Driver._time_dependence(term, t=1e-11)
+    tlist, dtlist = _time_dependence_loop(func, 1e-11, 1e-13)
+
+    assert len(term.tlist) == len(tlist) == 101
+    assert np.allclose(term.tlist, tlist)
+    assert np.allclose(term.dtlist, dtlist)
+
+
+_AMPLITUDE = 1.0
+
+
+def _pulse(t):
+    return _AMPLITUDE * math.sin(2e10 * t)
+
+
+def test_time_dependence_changed_global(monkeypatch):
+    # more than 10 000 steps, evaluated individually (math.sin raises for arrays)
+    term = types.SimpleNamespace(func=_pulse, dt=1e-13)
+    for amplitude in [1.0, 3.0, 5.0]:
+        monkeypatch.setitem(globals(), "_AMPLITUDE", amplitude)
+        oc.Driver._time_dependence(term, t=1e-9)
+        assert len(term.tlist) == 10_001
+        assert max(term.tlist) == pytest.approx(amplitude, rel=1e-3)
+
+
+def test_time_dependence_without_t():
+    term = types.SimpleNamespace(func=np.sin, dt=1e-13)
+    with pytest.raises(RuntimeError):
+        oc.Driver._time_dependence(term, n=5)
+
+
+@pytest.mark.parametrize("representation", ["bin8", "bin4", "txt"])
+def test_read_omf_array(tmp_path, representation):
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(5e-9, 4e-9, 3e-9), cell=(1e-9, 1e-9, 1e-9))
+    field = df.Field(mesh, nvdim=3, value=lambda p: (p[0], p[1], p[2]))
+    filename = tmp_path / "m.omf"
+    field.to_file(filename, representation=representation)
+
+    array = oc.Driver._read_omf_array(filename, field.array.shape)
+    if representation == "bin8":
+        assert array.shape == field.array.shape
+        assert np.array_equal(array, df.Field.from_file(filename).array)
+    else:
+        assert array is None
+
+    # wrong mesh
+    assert oc.Driver._read_omf_array(filename, (3, 4, 5, 3)) is None
+
+
+def test_read_omf_array_empty_file(tmp_path):
+    filename = tmp_path / "m.omf"
+    filename.touch()
+    assert oc.Driver._read_omf_array(filename, (1, 1, 1, 3)) is None
+
+
+def test_setup_working_directory(tmp_path):
+    system = mm.examples.macrospin()
+    for i in range(3):
+        workingdir = oc.Driver._setup_working_directory(system, tmp_path, "drive")
+        assert workingdir == tmp_path / "macrospin" / f"drive-{i}"
+        assert system.drive_number == i
+
+    # the highest existing number wins, other directories are ignored
+    (tmp_path / "macrospin" / "drive-7").mkdir()
+    (tmp_path / "macrospin" / "drive-\u00b2").mkdir()
+    (tmp_path / "macrospin" / "drive-old").mkdir()
+    workingdir = oc.Driver._setup_working_directory(system, tmp_path, "drive")
+    assert workingdir == tmp_path / "macrospin" / "drive-8"
+    assert system.drive_number == 8
+
+    workingdir = oc.Driver._setup_working_directory(system, tmp_path, "compute")
+    assert workingdir == tmp_path / "macrospin" / "compute-0"
+
+    with pytest.raises(FileExistsError):
+        oc.Driver._setup_working_directory(system, tmp_path, "drive", append=False)
+
+
+def test_drive_many_failed_run(tmp_path, monkeypatch):
+    class Runner:
+        def call(self, argstr, n_threads=None, verbose=1, cwd=None):
+            if cwd.name == "drive-1":
+                raise RuntimeError("OOMMF failed.")
+
+    systems = [mm.examples.macrospin() for _ in range(4)]
+    td = oc.TimeDriver()
+    read = []
+
+    def read_data(system):
+        if system is systems[2]:
+            raise FileNotFoundError("No output.")
+        read.append(system)
+
+    monkeypatch.setattr(td, "_read_data", read_data)
+
+    with pytest.raises(RuntimeError, match="OOMMF failed."):
+        td.drive_many(
+            systems, dirname=tmp_path, runner=Runner(), t=1e-12, n=5, verbose=0
+        )
+
+    # results of the successful runs are read
+    assert read == [systems[0], systems[3]]
+    assert [system.drive_number for system in systems] == [1, 1, 2, 4]
+
+
+def test_schedule_many_without_systems(tmp_path):
+    td = oc.TimeDriver()
+    with pytest.raises(ValueError):
+        td.schedule_many([], "bash", "#!/bin/bash", dirname=tmp_path, t=1e-12, n=5)
+    assert not (tmp_path / "job.sh").exists()
+
+
+def test_info_json_not_serialisable(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = mm.examples.macrospin()
+    td = oc.TimeDriver()
+    td._write_info_json(system, n=5)
+    info = (tmp_path / "info.json").read_text()
+
+    with pytest.raises(TypeError):
+        td._write_info_json(system, n=np.int64(5))
+
+    # the previous file is kept and no temporary file is left behind
+    assert (tmp_path / "info.json").read_text() == info
+    assert [path.name for path in tmp_path.iterdir()] == ["info.json"]
@@ -231,3 +231,47 @@ def test_silent(capsys):
     captured = capsys.readouterr()
     assert captured.out == ""
     assert captured.err == ""
+
+
+def test_drive_many(capsys):
+    systems = [mm.examples.macrospin() for _ in range(3)]
+    initial_m = [system.m.array.copy() for system in systems]
+
+    td = oc.TimeDriver()
+    td.drive_many(systems, t=1e-12, n=5, max_parallel=2)
+    captured = capsys.readouterr()
+    assert "Running OOMMF for 3 systems (2 parallel)" in captured.out
+
+    drive_numbers = sorted(system.drive_number for system in systems)
+    assert drive_numbers == list(range(drive_numbers[0], drive_numbers[0] + 3))
+    for system, m in zip(systems, initial_m):
+        assert len(system.table.data) == 5
+        assert not (system.m.array == m).all()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires a POSIX shell.")
+def test_schedule_many(tmp_path):
+    header = tmp_path / "header.sh"
+    header.write_text("#!/bin/bash\n#SBATCH -n 1\necho start")
+    systems = [mm.examples.macrospin() for _ in range(3)]
+
+    td = oc.TimeDriver()
+    # Without a task index no drive is run by the script.
+    td.schedule_many(
+        systems,
+        "bash",
+        str(header),
+        dirname=str(tmp_path),
+        runner=oo.DockerOOMMFRunner(),
+        t=1e-12,
+        n=5,
+        verbose=0,
+    )
+
+    script = (tmp_path / "job.sh").read_text().split("\n")
+    assert script[:3] == ["#!/bin/bash", "#SBATCH --array=0-2", "#SBATCH -n 1"]
+    assert "case $SLURM_ARRAY_TASK_ID in" in script
+    for i in range(3):
+        assert (tmp_path / "macrospin" / f"drive-{i}" / "macrospin.mif").exists()
+        assert f'    cd "{tmp_path / "macrospin" / f"drive-{i}"}"' in script
+    assert [system.drive_number for system in systems] == [1, 2, 3]